@@ -1,11 +1,44 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import bisect
 import json
 import logging
-import os
+import logging.handlers
 import sys
-from typing import Dict, List
+from collections import defaultdict
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
+
+
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+# Ключ упорядочивания поездов - время отправления.
+_KEY = itemgetter("time_departure")
+
+
+def _normalize(destination: str) -> str:
+    """
+    Привести пункт назначения к ключу индекса поездов
+    (строка в нижнем регистре).
+
+    :param destination: Пункт назначения.
+    :return: Ключ для индекса поездов по пункту назначения.
+    """
+
+    return destination.lower()
+
+
+# Разделитель и заголовок таблицы поездов (формируются один раз).
+_TABLE_LINE = "+-{}-+-{}-+-{}-+-{}-+-{}-+".format("-" * 4, "-" * 20, "-" * 13, "-" * 18, "-" * 20)
+_TABLE_HEADER = "| {:^4} | {:^20} | {:^13} | {:^18} | {:^20} |".format(
+    "№", "Пункт отправления", "№ поезда", "Время отправления", "Пункт назначения"
+)
+_TABLE_TOP = "\n".join([_TABLE_LINE, _TABLE_HEADER, _TABLE_LINE])
 
 
 class UnknownCommandError(Exception):
@@ -55,8 +88,13 @@ class TrainManager:
     def __init__(self) -> None:
         """
         Инициализировать пустой список поездов.
+        Параллельно хранятся список времён отправления (ключей сортировки),
+        упорядоченный так же, как и список поездов, и индекс поездов
+        по пункту назначения в нижнем регистре.
         """
         self.trains: List[Dict[str, str]] = []
+        self._keys: List[str] = []
+        self._by_dest: Dict[str, List[Dict[str, str]]] = defaultdict(list)
 
     def add_train(self, departure_point: str, number_train: str, time_departure: str, destination: str) -> None:
         """
@@ -68,7 +106,9 @@ class TrainManager:
           "time_departure": <время отправления>,
           "destination": <пункт назначения>
         }
-        После добавления список поездов упорядочивается по времени отправления.
+        Поезд вставляется в позицию, сохраняющую упорядоченность списка
+        по времени отправления (двоичный поиск по списку ключей);
+        поезд с самым поздним временем просто добавляется в конец.
 
         :param departure_point: Пункт отправления;
         :param number_train: Номер поезда;
@@ -78,19 +118,34 @@ class TrainManager:
         После успешного добавления поезда информация вносится в лог-файл.
         """
 
-        self.trains.append(
-            {
-                "departure_point": departure_point,
-                "number_train": number_train,
-                "time_departure": time_departure,
-                "destination": destination,
-            }
-        )
-        self.trains.sort(key=lambda train: train["time_departure"])
+        train = {
+            "departure_point": departure_point,
+            "number_train": number_train,
+            "time_departure": time_departure,
+            "destination": destination,
+        }
+        # Поезда чаще всего добавляются в хронологическом порядке:
+        # тогда достаточно добавить поезд в конец без поиска позиции.
+        if not self._keys or time_departure >= self._keys[-1]:
+            self._keys.append(time_departure)
+            self.trains.append(train)
+        else:
+            idx = bisect.bisect_right(self._keys, time_departure)
+            self._keys.insert(idx, time_departure)
+            self.trains.insert(idx, train)
+
+        bucket = self._by_dest[_normalize(destination)]
+        if not bucket or time_departure >= bucket[-1]["time_departure"]:
+            bucket.append(train)
+        else:
+            bucket.insert(bisect.bisect_right(bucket, time_departure, key=_KEY), train)
+
         logging.info(
-            f"Добавлен поезд: пункт отправления={departure_point}, "
-            f"№={number_train}, время={time_departure}, "
-            f"пункт назначения={destination}"
+            "Добавлен поезд: пункт отправления=%s, №=%s, время=%s, пункт назначения=%s",
+            departure_point,
+            number_train,
+            time_departure,
+            destination,
         )
 
     def list_trains(self) -> List[Dict[str, str]]:
@@ -102,6 +157,23 @@ class TrainManager:
 
         return self.trains
 
+    def iter_select_trains(self, point_user: str) -> Iterator[Dict[str, str]]:
+        """
+        Перебрать поезда, пункт назначения которых совпадает с point_user,
+        не создавая промежуточного списка.
+        Количество найденных поездов логгируется после завершения перебора.
+
+        :param point_user: Пункт назначения (введенный пользователем).
+        :return: Итератор по таким поездам.
+        """
+
+        point_user = _normalize(point_user)
+        count = 0
+        for train in self._by_dest.get(point_user, ()):
+            count += 1
+            yield train
+        logging.info("Выполнен поиск поездов по пункту назначения='%s'. Найдено %d поезд(а).", point_user, count)
+
     def select_trains(self, point_user: str) -> List[Dict[str, str]]:
         """
         Выбрать поезда, пункт назначения которых совпадает с point_user.
@@ -111,12 +183,22 @@ class TrainManager:
         :return: Список таких поездов (может быть пустым).
         """
 
-        point_user = point_user.lower()
-        selected = [train for train in self.trains if train["destination"].lower() == point_user]
-        logging.info(
-            f"Выполнен поиск поездов по пункту назначения='{point_user}'. " f"Найдено {len(selected)} поезд(а)."
-        )
-        return selected
+        return list(self.iter_select_trains(point_user))
+
+    @staticmethod
+    def _build_index(trains: List[Dict[str, str]]) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Построить индекс поездов по пункту назначения.
+        Поезда в каждой группе идут в том же порядке, что и в списке trains.
+
+        :param trains: Список поездов, упорядоченный по времени отправления.
+        :return: Индекс поездов по пункту назначения.
+        """
+
+        by_dest: Dict[str, List[Dict[str, str]]] = defaultdict(list)
+        for train in trains:
+            by_dest[_normalize(train["destination"])].append(train)
+        return by_dest
 
     def load_from_json(self, filename: str) -> None:
         """
@@ -124,16 +206,33 @@ class TrainManager:
         Если файл отсутствует список остаётся пустым или прежним.
         При успешной загрузке записывается соответствующее сообщение в лог.
         Если файл не существует, в лог также добавляется предупреждение.
+        Если данные в файле некорректны, возбуждается исключение,
+        а текущий список поездов не изменяется.
 
         :param filename: Имя файла для загрузки.
         """
 
-        if os.path.exists(filename):
-            with open(filename, "r", encoding="utf-8") as f:
-                self.trains = json.load(f)
-            logging.info(f"Данные успешно загружены из файла: {filename}.")
-        else:
-            logging.warning(f"Файл {filename} не найден. Загрузка не выполнена.")
+        # Файл читается целиком одним вызовом, json.loads (или orjson.loads,
+        # если он установлен) самостоятельно декодирует байты в UTF-8.
+        try:
+            with open(filename, "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            logging.warning("Файл %s не найден. Загрузка не выполнена.", filename)
+            return
+
+        # Новое состояние полностью строится в локальных переменных и
+        # присваивается только после успешного разбора, сортировки и
+        # построения индекса: при ошибке прежние данные не изменяются.
+        trains = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        trains.sort(key=_KEY)
+        keys = [train["time_departure"] for train in trains]
+        by_dest = self._build_index(trains)
+
+        self.trains = trains
+        self._keys = keys
+        self._by_dest = by_dest
+        logging.info("Данные успешно загружены из файла: %s.", filename)
 
     def save_to_json(self, filename: str) -> None:
         """
@@ -147,39 +246,204 @@ class TrainManager:
         if not filename.endswith(".json"):
             filename += ".json"
 
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(self.trains, f, ensure_ascii=False, indent=4)
+        # Сериализация целиком в байты UTF-8 и одна запись в файл
+        # в двоичном режиме вместо множества мелких вызовов write()
+        # внутри json.dump. Сохранение всегда выполняется модулем json,
+        # чтобы формат файла не зависел от наличия orjson.
+        data = json.dumps(self.trains, ensure_ascii=False, indent=4).encode("utf-8")
 
-        logging.info(f"Данные сохранены в файл: {filename}.")
+        with open(filename, "wb") as f:
+            f.write(data)
 
+        logging.info("Данные сохранены в файл: %s.", filename)
 
-def print_trains(trains: List[Dict[str, str]]) -> None:
+
+def print_trains(trains: Iterable[Dict[str, str]]) -> None:
     """
     Напечатать таблицу поездов в табличном формате.
-    Если список пуст, выводится сообщение о пустом списке.
+    Если поездов нет, выводится сообщение о пустом списке.
 
-    :param trains: Список поездов.
+    :param trains: Список (или итератор) поездов.
     """
 
-    if not trains:
+    # Каждая строка таблицы сразу дополняется разделителем.
+    rows: List[str] = []
+    rows_append = rows.append
+    for idx, train in enumerate(trains, 1):
+        rows_append(
+            f"| {idx:>4} | {train['departure_point']:<20} | {train['number_train']:<13} | "
+            f"{train['time_departure']:>18} | {train['destination']:<20} |\n{_TABLE_LINE}"
+        )
+
+    if not rows:
         print("Список поездов пуст или ничего не найдено.")
         return
 
-    line = "+-{}-+-{}-+-{}-+-{}-+-{}-+".format("-" * 4, "-" * 20, "-" * 13, "-" * 18, "-" * 20)
-    print(line)
-    print(
-        "| {:^4} | {:^20} | {:^13} | {:^18} | {:^20} |".format(
-            "№", "Пункт отправления", "№ поезда", "Время отправления", "Пункт назначения"
-        )
-    )
-    print(line)
-    for idx, train in enumerate(trains, 1):
-        print(
-            "| {:>4} | {:<20} | {:<13} | {:>18} | {:<20} |".format(
-                idx, train["departure_point"], train["number_train"], train["time_departure"], train["destination"]
-            )
-        )
-        print(line)
+    # Вся таблица выводится одной записью в стандартный поток вывода.
+    sys.stdout.write(f"{_TABLE_TOP}\n" + "\n".join(rows) + "\n")
+
+
+def _read_line(prompt: str) -> str:
+    """
+    Прочитать строку, введённую пользователем.
+    В интерактивном режиме выводится приглашение prompt,
+    при перенаправленном вводе строка читается из sys.stdin без приглашения.
+
+    :param prompt: Текст приглашения к вводу.
+    :return: Введённая строка без символа перевода строки.
+    :raises EOFError: Если достигнут конец ввода.
+    """
+
+    if sys.stdin.isatty():
+        return input(prompt)
+
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError("Достигнут конец ввода")
+    return line.rstrip("\n")
+
+
+def _command_exit(manager: TrainManager, arg: str) -> bool:
+    """
+    Команда exit: завершить работу программы.
+
+    :param manager: Менеджер списка поездов;
+    :param arg: Аргумент команды (не используется).
+    :return: True - цикл обработки команд должен быть остановлен.
+    """
+
+    logging.info("Программа завершена по команде 'exit'.")
+    print("Программа завершена.")
+    return True
+
+
+def _command_add(manager: TrainManager, arg: str) -> bool:
+    """
+    Команда add: запросить у пользователя данные поезда и добавить его.
+
+    :param manager: Менеджер списка поездов;
+    :param arg: Аргумент команды (не используется).
+    :return: False - цикл обработки команд продолжается.
+    """
+
+    departure_point = _read_line("Пункт отправления? ")
+    number_train = _read_line("Номер поезда? ")
+    time_departure = _read_line("Время отправления? ")
+    destination = _read_line("Пункт назначения? ")
+    manager.add_train(departure_point, number_train, time_departure, destination)
+    print("Поезд добавлен.")
+    return False
+
+
+def _command_list(manager: TrainManager, arg: str) -> bool:
+    """
+    Команда list: вывести список всех поездов.
+
+    :param manager: Менеджер списка поездов;
+    :param arg: Аргумент команды (не используется).
+    :return: False - цикл обработки команд продолжается.
+    """
+
+    trains_list = manager.list_trains()
+    print_trains(trains_list)
+    logging.info("Выведен список из %d поезд(ов).", len(trains_list))
+    return False
+
+
+def _command_select(manager: TrainManager, arg: str) -> bool:
+    """
+    Команда select <пункт_назначения>: вывести поезда по пункту назначения.
+
+    :param manager: Менеджер списка поездов;
+    :param arg: Пункт назначения.
+    :return: False - цикл обработки команд продолжается.
+    """
+
+    print_trains(manager.iter_select_trains(arg))
+    return False
+
+
+def _command_load(manager: TrainManager, arg: str) -> bool:
+    """
+    Команда load <имя_файла>: загрузить данные из файла JSON.
+
+    :param manager: Менеджер списка поездов;
+    :param arg: Имя файла для загрузки.
+    :return: False - цикл обработки команд продолжается.
+    """
+
+    manager.load_from_json(arg)
+    print(f"Данные загружены из файла {arg}.")
+    return False
+
+
+def _command_save(manager: TrainManager, arg: str) -> bool:
+    """
+    Команда save <имя_файла>: сохранить данные в файл JSON.
+
+    :param manager: Менеджер списка поездов;
+    :param arg: Имя файла для сохранения.
+    :return: False - цикл обработки команд продолжается.
+    """
+
+    manager.save_to_json(arg)
+    print(f"Данные сохранены в файл {arg}.")
+    return False
+
+
+def _command_help(manager: TrainManager, arg: str) -> bool:
+    """
+    Команда help: показать справку по командам.
+
+    :param manager: Менеджер списка поездов;
+    :param arg: Аргумент команды (не используется).
+    :return: False - цикл обработки команд продолжается.
+    """
+
+    print("Список доступных команд:")
+    print("add  - добавить поезд;")
+    print("list - вывести список всех поездов;")
+    print("select <пункт_назначения> - вывести поезда по пункту назначения;")
+    print("load <имя_файла> - загрузить данные из файла JSON;")
+    print("save <имя_файла> - сохранить данные в файл JSON;")
+    print("help - показать справку;")
+    print("exit - завершить работу.")
+    return False
+
+
+# Таблица команд: имя команды -> (обработчик, требуется ли аргумент).
+# Обработчик возвращает True, если работу программы нужно завершить.
+_COMMANDS: Dict[str, Tuple[Callable[[TrainManager, str], bool], bool]] = {
+    "exit": (_command_exit, False),
+    "add": (_command_add, False),
+    "list": (_command_list, False),
+    "select": (_command_select, True),
+    "load": (_command_load, True),
+    "save": (_command_save, True),
+    "help": (_command_help, False),
+}
+
+
+def _read_commands() -> Iterator[str]:
+    """
+    Перебрать строки команд, введённые пользователем.
+    В интерактивном режиме команды читаются через input() с приглашением,
+    если же ввод перенаправлен (например, из файла сценария),
+    строки читаются напрямую из sys.stdin без вывода приглашения.
+    Перебор завершается по достижении конца ввода.
+
+    :return: Итератор по строкам команд.
+    """
+
+    if not sys.stdin.isatty():
+        yield from sys.stdin
+        return
+
+    while True:
+        try:
+            yield input(">>> ")
+        except EOFError:
+            return
 
 
 def main() -> None:
@@ -190,71 +454,35 @@ def main() -> None:
     регистрируются в лог-файле "trains.log".
     """
 
+    # Записи журнала накапливаются в памяти и сбрасываются в файл пачками;
+    # ошибки записываются сразу, остаток - при завершении программы.
+    file_handler = logging.FileHandler("trains.log", mode="a", encoding="utf-8", delay=True)
+    file_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
     logging.basicConfig(
-        filename="trains.log",
         level=logging.INFO,
-        format="%(asctime)s [%(levelname)s] %(message)s",
+        handlers=[logging.handlers.MemoryHandler(capacity=256, flushLevel=logging.ERROR, target=file_handler)],
     )
 
     manager = TrainManager()
     logging.info("Программа запущена.")
 
-    while True:
+    for line in _read_commands():
         try:
-            command = input(">>> ").strip().lower()
-            logging.info(f"Введена команда: '{command}'")
-
-            if command == "exit":
-                logging.info("Программа завершена по команде 'exit'.")
-                print("Программа завершена.")
-                break
+            command = line.strip().lower()
+            logging.info("Введена команда: '%s'", command)
 
-            elif command == "add":
-                departure_point = input("Пункт отправления? ")
-                number_train = input("Номер поезда? ")
-                time_departure = input("Время отправления? ")
-                destination = input("Пункт назначения? ")
-                manager.add_train(departure_point, number_train, time_departure, destination)
-                print("Поезд добавлен.")
-
-            elif command == "list":
-                trains_list = manager.list_trains()
-                print_trains(trains_list)
-                logging.info(f"Выведен список из {len(trains_list)} поезд(ов).")
-
-            elif command.startswith("select "):
-                parts = command.split(maxsplit=1)
-                point_user = parts[1]
-                selected = manager.select_trains(point_user)
-                print_trains(selected)
-
-            elif command.startswith("load "):
-                parts = command.split(maxsplit=1)
-                filename = parts[1]
-                manager.load_from_json(filename)
-                print(f"Данные загружены из файла {filename}.")
-
-            elif command.startswith("save "):
-                parts = command.split(maxsplit=1)
-                filename = parts[1]
-                manager.save_to_json(filename)
-                print(f"Данные сохранены в файл {filename}.")
-
-            elif command == "help":
-                print("Список доступных команд:")
-                print("add  - добавить поезд;")
-                print("list - вывести список всех поездов;")
-                print("select <пункт_назначения> - вывести поезда по пункту назначения;")
-                print("load <имя_файла> - загрузить данные из файла JSON;")
-                print("save <имя_файла> - сохранить данные в файл JSON;")
-                print("help - показать справку;")
-                print("exit - завершить работу.")
-
-            else:
+            verb, _, arg = command.partition(" ")
+            arg = arg.strip()
+            entry = _COMMANDS.get(verb)
+            if entry is None or entry[1] != bool(arg):
                 raise UnknownCommandError(command)
 
+            handler, _ = entry
+            if handler(manager, arg):
+                break
+
         except Exception as exc:
-            logging.error(f"Произошла ошибка: {exc}")
+            logging.error("Произошла ошибка: %s", exc)
             print(f"Ошибка: {exc}", file=sys.stderr)
 
 
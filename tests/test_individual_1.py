@@ -1,9 +1,17 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import io
+import json
+import logging
+import os
+import tempfile
 import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
 
-from src.individual_1 import TrainManager, UnknownCommandError
+import src.individual_1 as individual_1
+from src.individual_1 import TrainManager, UnknownCommandError, print_trains
 
 
 class TestTrainManager(unittest.TestCase):
@@ -56,6 +64,182 @@ class TestTrainManager(unittest.TestCase):
         none_selected = manager.select_trains("NonExistentCity")
         self.assertEqual(len(none_selected), 0)
 
+    def test_select_trains_order_and_case(self):
+        """
+        Проверяем, что выборка не зависит от регистра
+        и упорядочена по времени отправления.
+        """
+
+        manager = TrainManager()
+        manager.add_train("Moscow", "100A", "09:30", "Kazan")
+        manager.add_train("Tver", "300C", "06:00", "KAZAN")
+        manager.add_train("Sochi", "200B", "06:50", "Adler")
+        manager.add_train("Perm", "400D", "07:15", "kazan")
+
+        selected = manager.select_trains("kAzAn")
+
+        self.assertEqual([train["number_train"] for train in selected], ["300C", "400D", "100A"])
+
+    def test_save_and_load_json(self):
+        """
+        Проверяем, что сохранённый в JSON список поездов
+        загружается обратно без изменений.
+        """
+
+        manager = TrainManager()
+        manager.add_train("Moscow", "100A", "09:30", "Казань")
+        manager.add_train("Sochi", "200B", "06:50", "Adler")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # Расширение .json должно добавиться автоматически.
+            filename = os.path.join(tmp_dir, "trains")
+            manager.save_to_json(filename)
+
+            loaded = TrainManager()
+            loaded.load_from_json(filename + ".json")
+
+        self.assertEqual(loaded.list_trains(), manager.list_trains())
+
+    def test_save_and_load_json_stdlib(self):
+        """
+        Проверяем формат сохранённого файла и загрузку
+        стандартным модулем json (без orjson).
+        """
+
+        manager = TrainManager()
+        manager.add_train("Moscow", "100A", "09:30", "Казань")
+
+        with mock.patch("src.individual_1.orjson", None), tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "trains.json")
+            manager.save_to_json(filename)
+
+            with open(filename, "r", encoding="utf-8") as f:
+                text = f.read()
+
+            loaded = TrainManager()
+            loaded.load_from_json(filename)
+
+        expected = (
+            "[\n"
+            "    {\n"
+            '        "departure_point": "Moscow",\n'
+            '        "number_train": "100A",\n'
+            '        "time_departure": "09:30",\n'
+            '        "destination": "Казань"\n'
+            "    }\n"
+            "]"
+        )
+        self.assertEqual(text, expected)
+        self.assertEqual(loaded.list_trains(), manager.list_trains())
+
+    def test_load_json_orjson(self):
+        """
+        Проверяем, что при наличии orjson загрузка выполняется через orjson.loads
+        (orjson заменяется заглушкой, разбирающей байты модулем json).
+        """
+
+        manager = TrainManager()
+        manager.add_train("Moscow", "100A", "09:30", "Казань")
+        manager.add_train("Tver", "300C", "06:00", "Moscow")
+
+        orjson_stub = mock.Mock()
+        orjson_stub.loads.side_effect = json.loads
+
+        with mock.patch("src.individual_1.orjson", orjson_stub), tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "trains.json")
+            manager.save_to_json(filename)
+
+            loaded = TrainManager()
+            loaded.load_from_json(filename)
+
+        orjson_stub.loads.assert_called_once()
+        self.assertIsInstance(orjson_stub.loads.call_args.args[0], bytes)
+        self.assertEqual(loaded.list_trains(), manager.list_trains())
+        self.assertEqual(len(loaded.select_trains("казань")), 1)
+
+    def test_load_missing_file(self):
+        """
+        Проверяем, что загрузка из несуществующего файла
+        не изменяет текущий список поездов.
+        """
+
+        manager = TrainManager()
+        manager.add_train("Moscow", "100A", "09:30", "Kazan")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            manager.load_from_json(os.path.join(tmp_dir, "missing.json"))
+
+        self.assertEqual(len(manager.list_trains()), 1)
+        self.assertEqual(len(manager.select_trains("Kazan")), 1)
+
+    def test_load_invalid_file_keeps_state(self):
+        """
+        Проверяем, что ошибка при загрузке некорректного файла
+        (поезд без времени отправления) не изменяет текущие данные.
+        """
+
+        manager = TrainManager()
+        manager.add_train("Moscow", "100A", "10:00", "Kazan")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "bad.json")
+            with open(filename, "w", encoding="utf-8") as f:
+                f.write(
+                    '[{"departure_point": "Tver", "number_train": "300C", "time_departure": "06:00", '
+                    '"destination": "Moscow"}, {"departure_point": "Sochi", "number_train": "200B", '
+                    '"destination": "Adler"}]'
+                )
+
+            with self.assertRaises(KeyError):
+                manager.load_from_json(filename)
+
+        self.assertEqual([train["number_train"] for train in manager.list_trains()], ["100A"])
+        self.assertEqual(len(manager.select_trains("kazan")), 1)
+        self.assertEqual(manager.select_trains("moscow"), [])
+
+        # Добавление после неудачной загрузки сохраняет порядок.
+        manager.add_train("Tver", "300C", "06:00", "Kazan")
+        self.assertEqual([train["number_train"] for train in manager.select_trains("kazan")], ["300C", "100A"])
+
+    def test_print_trains(self):
+        """
+        Проверяем табличный вывод списка поездов
+        и сообщение для пустого списка.
+        """
+
+        manager = TrainManager()
+        manager.add_train("Moscow", "100A", "09:30", "Kazan")
+        manager.add_train("Tver", "300C", "06:00", "Moscow")
+
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            print_trains(manager.list_trains())
+
+        line = "+------+----------------------+---------------+--------------------+----------------------+"
+        expected = [
+            line,
+            "|  №   |  Пункт отправления   |   № поезда    | Время отправления  |   Пункт назначения   |",
+            line,
+            "|    1 | Tver                 | 300C          |              06:00 | Moscow               |",
+            line,
+            "|    2 | Moscow               | 100A          |              09:30 | Kazan                |",
+            line,
+        ]
+        self.assertEqual(buffer.getvalue(), "\n".join(expected) + "\n")
+
+        # Итератор выборки выводится так же, как и список.
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            print_trains(manager.iter_select_trains("kazan"))
+        kazan_row = "|    1 | Moscow               | 100A          |              09:30 | Kazan                |"
+        self.assertEqual(buffer.getvalue(), "\n".join([line, expected[1], line, kazan_row, line]) + "\n")
+
+        # Для пустого списка выводится только сообщение.
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            print_trains([])
+        self.assertEqual(buffer.getvalue(), "Список поездов пуст или ничего не найдено.\n")
+
     def test_unknown_command_error(self):
         """
         Проверяем, что исключение UnknownCommandError
@@ -70,5 +254,189 @@ class TestTrainManager(unittest.TestCase):
         self.assertIn("Неизвестная команда", str(context.exception))
 
 
+def read_log():
+    """
+    Прочитать лог-файл "trains.log" в текущем каталоге.
+
+    :return: Содержимое файла или None, если файл ещё не создан.
+    """
+
+    if not os.path.exists("trains.log"):
+        return None
+    with open("trains.log", "r", encoding="utf-8") as f:
+        return f.read()
+
+
+class ScriptedStdin:
+    """
+    Перенаправленный ввод, который перед выдачей каждой строки
+    сохраняет текущее содержимое лог-файла.
+    """
+
+    def __init__(self, lines):
+        self.lines = lines
+        self.log_snapshots = []
+
+    def isatty(self):
+        return False
+
+    def __iter__(self):
+        for line in self.lines:
+            self.log_snapshots.append(read_log())
+            yield line
+
+
+class TestMain(unittest.TestCase):
+    def run_main(self, script):
+        """
+        Выполнить main() с перенаправленным вводом script (строка
+        или объект, подставляемый вместо sys.stdin) во временном каталоге.
+        Обработчики и уровень корневого логгера на время выполнения
+        заменяются, чтобы main() настроил журнал заново, а после
+        выполнения восстанавливаются.
+
+        :return: Содержимое стандартного потока вывода, потока ошибок
+                 и лог-файла "trains.log" после закрытия журнала.
+        """
+
+        root = logging.getLogger()
+        saved_handlers, saved_level = root.handlers[:], root.level
+        root.handlers.clear()
+        cwd = os.getcwd()
+        stdout, stderr = io.StringIO(), io.StringIO()
+        stdin = io.StringIO(script) if isinstance(script, str) else script
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            os.chdir(tmp_dir)
+            try:
+                with mock.patch("sys.stdin", stdin), redirect_stdout(stdout), redirect_stderr(stderr):
+                    individual_1.main()
+            finally:
+                # Закрываем обработчики, добавленные main(). MemoryHandler.close()
+                # сбрасывает target, поэтому он запоминается заранее.
+                for handler in root.handlers[:]:
+                    target = getattr(handler, "target", None)
+                    root.removeHandler(handler)
+                    handler.close()
+                    if target is not None:
+                        target.close()
+                root.handlers[:] = saved_handlers
+                root.setLevel(saved_level)
+                log_text = read_log()
+                os.chdir(cwd)
+        return stdout.getvalue(), stderr.getvalue(), log_text
+
+    def test_stops_at_end_of_input(self):
+        """
+        Проверяем, что при перенаправленном вводе main() завершается
+        по достижении конца ввода, а приглашения не выводятся.
+        """
+
+        stdout, stderr, _ = self.run_main("add\nMoscow\n100A\n09:30\nKazan\nlist\n")
+
+        self.assertEqual(stderr, "")
+        self.assertNotIn(">>>", stdout)
+        self.assertNotIn("?", stdout)
+        self.assertTrue(stdout.startswith("Поезд добавлен.\n"))
+        self.assertIn("| Moscow               | 100A          |", stdout)
+
+    def test_select_command(self):
+        """
+        Проверяем разбор команды select: лишние пробелы перед аргументом
+        допускаются, а команда без аргумента считается неизвестной.
+        """
+
+        script = "add\nMoscow\n100A\n09:30\nKazan\nselect    Kazan\nselect\nselect \n"
+        stdout, stderr, _ = self.run_main(script)
+
+        self.assertIn("|    1 | Moscow               | 100A          |", stdout)
+        self.assertEqual(
+            stderr,
+            "Ошибка: select -> Неизвестная команда\nОшибка: select -> Неизвестная команда\n",
+        )
+
+    def test_unknown_commands(self):
+        """
+        Проверяем, что неизвестная команда и команды без аргумента,
+        введённые с аргументом, сообщаются как ошибки.
+        """
+
+        stdout, stderr, _ = self.run_main("foo\nlist foo\nhelp me\nexit now\nlist\n")
+
+        self.assertEqual(
+            stderr.splitlines(),
+            [
+                "Ошибка: foo -> Неизвестная команда",
+                "Ошибка: list foo -> Неизвестная команда",
+                "Ошибка: help me -> Неизвестная команда",
+                "Ошибка: exit now -> Неизвестная команда",
+            ],
+        )
+        # Цикл продолжает работу после ошибок.
+        self.assertEqual(stdout, "Список поездов пуст или ничего не найдено.\n")
+
+    def test_exit_stops_loop(self):
+        """
+        Проверяем, что команда exit завершает цикл
+        и следующие команды не выполняются.
+        """
+
+        stdout, stderr, _ = self.run_main("EXIT\nlist\nfoo\n")
+
+        self.assertEqual(stdout, "Программа завершена.\n")
+        self.assertEqual(stderr, "")
+
+    def test_log_buffered_until_shutdown(self):
+        """
+        Проверяем, что записи уровня INFO накапливаются в памяти
+        и попадают в лог-файл только при завершении работы.
+        """
+
+        stdin = ScriptedStdin(["list\n", "exit\n"])
+        _, _, log_text = self.run_main(stdin)
+
+        # Пока выполнялись команды, файл журнала не создавался.
+        self.assertEqual(stdin.log_snapshots, [None, None])
+        messages = [line.split("] ", 1)[1] for line in log_text.splitlines()]
+        self.assertEqual(
+            messages,
+            [
+                "Программа запущена.",
+                "Введена команда: 'list'",
+                "Выведен список из 0 поезд(ов).",
+                "Введена команда: 'exit'",
+                "Программа завершена по команде 'exit'.",
+            ],
+        )
+        self.assertNotIn("[ERROR]", log_text)
+
+    def test_log_error_flushed_immediately(self):
+        """
+        Проверяем, что запись уровня ERROR сразу записывается в лог-файл
+        вместе с накопленными до неё записями.
+        """
+
+        stdin = ScriptedStdin(["foo\n", "exit\n"])
+        _, _, log_text = self.run_main(stdin)
+
+        before_foo, before_exit = stdin.log_snapshots
+        self.assertIsNone(before_foo)
+        self.assertIn("[INFO] Введена команда: 'foo'", before_exit)
+        self.assertTrue(before_exit.endswith("[ERROR] Произошла ошибка: foo -> Неизвестная команда\n"))
+        self.assertNotIn("exit", before_exit)
+        self.assertTrue(log_text.startswith(before_exit))
+        self.assertIn("Программа завершена по команде 'exit'.", log_text)
+
+    def test_end_of_input_inside_add(self):
+        """
+        Проверяем, что конец ввода посреди команды add
+        сообщается как ошибка и main() завершается.
+        """
+
+        stdout, stderr, _ = self.run_main("add\nMoscow\n")
+
+        self.assertEqual(stdout, "")
+        self.assertIn("Ошибка: Достигнут конец ввода", stderr)
+
+
 if __name__ == "__main__":
     unittest.main()